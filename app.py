@@ -1,17 +1,27 @@
 import os
 import re
 import time
+import atexit
+import queue
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from slack_bolt import App
 from slack_bolt.adapter.flask import SlackRequestHandler
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler, RateLimitErrorRetryHandler
 from flask import Flask, request
 
 SAVE_FLAG_REGEX = re.compile(r"--save(d)?\b", re.IGNORECASE)
 AREA51_TRIGGER_REGEX = re.compile(r"(^|\s)@?area51(\s|$)", re.IGNORECASE)
 CATCHUP_TRIGGER_REGEX = re.compile(r"(^|\s)@catchup(\s|$)", re.IGNORECASE)
-CANVAS_ID_REGEX = re.compile(r"^F[A-Z0-9]{8,}$")
-SLACK_USER_ID_REGEX = re.compile(r"^[UW][A-Z0-9]+$")
+CANVAS_ID_REGEX = re.compile(r"F[A-Z0-9]{8,}")
+SLACK_USER_ID_REGEX = re.compile(r"[UW][A-Z0-9]+")
+# Bound once so hot paths skip the attribute lookup.
+_CANVAS_FULLMATCH = CANVAS_ID_REGEX.fullmatch
+_SLACK_USER_ID_FULLMATCH = SLACK_USER_ID_REGEX.fullmatch
 WELCOME_TEXT = "Bhai apnader jonne kaz korte chole ashlam"
 AREA51_MEMBER_IDS = [
     "Rumman",
@@ -20,7 +30,9 @@ AREA51_MEMBER_IDS = [
     "Intishar Ishmam",
 ]
 AREA51_MESSAGE_TEXT = "\n Anik bhai sobaire meeting e dakse, Sobai ashen !! :rocket: \n Eta apnader meeting link:https://meet.google.com/eea-ubxh-qfi . \n Join koren, Ami ektu chill kori :sunglasses: "
-AREA51_USER_ID_CACHE = {}
+AREA51_USER_ID_CACHE = OrderedDict()
+_AREA51_RESOLVED = None
+_AREA51_PAYLOAD_CACHE = None  # full outgoing text once every member is resolved
 
 CATCHUP_MEMBER_IDS = [
     "Rumman",
@@ -30,12 +42,59 @@ CATCHUP_MEMBER_IDS = [
     "Ishmoth Ura Nuri",
 ]
 CATCHUP_MESSAGE_TEXT = "আসসালামু আলাইকুম , মুশফিক ভাইয়ের পক্ষ থেকে জানানো যাচ্ছে — সবাই ফ্রি থাকলে ভালো হয়, আর ৩–৫ মিনিট পর উনি একটু catch-up করতে চান। লিংকে join দেন https://meet.google.com/kkh-sxvp-xwy :rocket:"
-CATCHUP_USER_ID_CACHE = {}
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-)
+CATCHUP_USER_ID_CACHE = OrderedDict()
+_CATCHUP_RESOLVED = None
+_CATCHUP_PAYLOAD_CACHE = None  # full outgoing text once every member is resolved
+
+# users.list is paginated and rate limited, so keep the built index around.
+USER_INDEX_TTL_SECONDS = 600
+# The index may be partial: lookups stop paginating once their keys are found.
+_USER_INDEX_CACHE = {"index": {}, "expires": 0.0, "complete": False}
+_USER_INDEX_LOCK = threading.Lock()
+
+# Long-lived caches are bounded LRUs (OrderedDict + _lru_get/_lru_set) so a
+# long-running process can't grow them without limit.
+USER_ID_CACHE_MAX_SIZE = 1024
+CANVAS_ID_CACHE_MAX_SIZE = 1024
+_LRU_LOCK = threading.Lock()
+
+DISPLAY_NAME_TTL_SECONDS = 600
+DISPLAY_NAME_CACHE_MAX_SIZE = 1024
+_DISPLAY_NAME_CACHE = OrderedDict()  # user_id -> (cached_at, display_name)
+
+# Shared read-only fallback for missing nested payloads; never mutate it.
+_EMPTY_PAYLOAD = {}
+
+# channel_id -> canvas_id; a channel canvas keeps its id once created.
+_CANVAS_ID_CACHE = OrderedDict()
+
+# The bot's user_id/bot_id never change for the lifetime of the process.
+_BOT_IDENTITY = None
+_BOT_IDENTITY_LOCK = threading.Lock()
+
+# Listener threads only enqueue log records; a background QueueListener owns
+# the stream, so a slow stdout/stderr never blocks Slack handling.
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_queue_handler = QueueHandler(_log_queue)
+# Only merge msg % args on the caller; timestamps etc. are formatted by the listener.
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Bolt auto-acks Events API requests and then runs listeners on this pool;
+# naming it lets us size it instead of relying on Bolt's 5-worker default.
+# The work is almost entirely waiting on Slack, so the pools can be sized well
+# past the CPU count; tune per deploy with the env vars below.
+LISTENER_WORKERS = int(os.environ.get("SLACK_LISTENER_WORKERS", 8))
+SLACK_CALL_WORKERS = int(os.environ.get("SLACK_CALL_WORKERS", 8))
+_LISTENER_EXECUTOR = ThreadPoolExecutor(max_workers=LISTENER_WORKERS, thread_name_prefix="slack-listener")
+# Independent Slack calls made from inside a listener. Kept apart from the
+# listener pool so a busy listener pool can't starve its own sub-tasks.
+_SLACK_CALL_EXECUTOR = ThreadPoolExecutor(max_workers=SLACK_CALL_WORKERS, thread_name_prefix="slack-call")
 
 bolt_app = App(
     token=os.environ["SLACK_BOT_TOKEN"],
@@ -43,30 +102,72 @@ bolt_app = App(
     # Required so the bot can process its own channel_join system message
     # and send the welcome text on join/rejoin.
     ignoring_self_events_enabled=False,
+    listener_executor=_LISTENER_EXECUTOR,
 )
+# Bolt builds a fresh WebClient per request, copying timeout and retry_handlers
+# from bolt_app.client, so configuring them here applies to every listener.
+# Connection failures and 429s (honouring Retry-After) are retried in the SDK.
+bolt_app.client.timeout = 10
+bolt_app.client.retry_handlers = [
+    ConnectionErrorRetryHandler(max_retry_count=2),
+    RateLimitErrorRetryHandler(max_retry_count=2),
+]
 
 
-def _extract_canvas_id(payload):
-    canvas_id = payload.get("canvas_id")
-    if canvas_id:
-        return canvas_id
+def _lru_get(cache, key):
+    with _LRU_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _lru_set(cache, key, value, max_size):
+    with _LRU_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _lru_pop(cache, key):
+    with _LRU_LOCK:
+        cache.pop(key, None)
+
+
+def _is_canvas_id(value):
+    # Length/prefix checks reject most non-ids before touching the regex.
+    return bool(value) and len(value) >= 9 and value[0] == "F" and _CANVAS_FULLMATCH(value) is not None
+
+
+def _is_slack_user_id(value):
+    return bool(value) and len(value) >= 2 and value[0] in "UW" and _SLACK_USER_ID_FULLMATCH(value) is not None
 
-    direct_canvas_id = payload.get("id") or payload.get("file_id")
-    if direct_canvas_id:
-        return direct_canvas_id
 
-    canvas = payload.get("canvas", {})
-    return canvas.get("id") or canvas.get("file_id")
+def _extract_canvas_id(payload):
+    canvas = payload.get("canvas") or _EMPTY_PAYLOAD
+    return (
+        payload.get("canvas_id")
+        or payload.get("id")
+        or payload.get("file_id")
+        or canvas.get("id")
+        or canvas.get("file_id")
+    )
 
 
 def _get_or_create_channel_canvas_id(client, channel_id, logger):
+    cached_canvas_id = _lru_get(_CANVAS_ID_CACHE, channel_id)
+    if _is_canvas_id(cached_canvas_id):
+        return cached_canvas_id
+
     try:
         created = client.conversations_canvases_create(
             channel_id=channel_id,
             document_content={"type": "markdown", "markdown": "# Saved Items\n"},
         )
         created_canvas_id = _extract_canvas_id(created)
-        if created_canvas_id and CANVAS_ID_REGEX.match(created_canvas_id):
+        if _is_canvas_id(created_canvas_id):
+            _lru_set(_CANVAS_ID_CACHE, channel_id, created_canvas_id, CANVAS_ID_CACHE_MAX_SIZE)
             return created_canvas_id
     except SlackApiError as e:
         if e.response.get("error") not in {
@@ -79,7 +180,8 @@ def _get_or_create_channel_canvas_id(client, channel_id, logger):
         try:
             info = client.conversations_info(channel=channel_id)
             existing_canvas_id = _extract_canvas_id(info.get("channel", {}).get("properties", {}).get("canvas", {}))
-            if existing_canvas_id and CANVAS_ID_REGEX.match(existing_canvas_id):
+            if _is_canvas_id(existing_canvas_id):
+                _lru_set(_CANVAS_ID_CACHE, channel_id, existing_canvas_id, CANVAS_ID_CACHE_MAX_SIZE)
                 return existing_canvas_id
         except SlackApiError:
             pass
@@ -96,11 +198,16 @@ def _get_user_display_name(client, user_id, logger):
     if not user_id:
         return "unknown user"
 
+    cached = _lru_get(_DISPLAY_NAME_CACHE, user_id)
+    if cached and time.monotonic() - cached[0] < DISPLAY_NAME_TTL_SECONDS:
+        return cached[1]
+
     try:
         info = client.users_info(user=user_id)
         user = info.get("user", {})
         profile = user.get("profile", {})
         display_name = profile.get("display_name") or profile.get("real_name") or user.get("name") or user_id
+        _lru_set(_DISPLAY_NAME_CACHE, user_id, (time.monotonic(), display_name), DISPLAY_NAME_CACHE_MAX_SIZE)
         return display_name
     except SlackApiError as e:
         logger.warning("Could not resolve user display name for %s: %s", user_id, e.response.get("error"))
@@ -108,122 +215,202 @@ def _get_user_display_name(client, user_id, logger):
 
 
 def _get_bot_member_ids(client, logger):
-    try:
-        auth = client.auth_test()
-        return auth.get("user_id", ""), auth.get("bot_id", "")
-    except SlackApiError as e:
-        logger.warning("Could not resolve bot identity: %s", e.response.get("error"))
+    global _BOT_IDENTITY
+    if _BOT_IDENTITY is not None:
+        return _BOT_IDENTITY
+
+    with _BOT_IDENTITY_LOCK:
+        if _BOT_IDENTITY is not None:
+            return _BOT_IDENTITY
+        try:
+            auth = client.auth_test()
+            _BOT_IDENTITY = (auth.get("user_id", ""), auth.get("bot_id", ""))
+            return _BOT_IDENTITY
+        except SlackApiError as e:
+            # Not cached, so the next event retries the lookup.
+            logger.warning("Could not resolve bot identity: %s", e.response.get("error"))
     return "", ""
 
 
 def _build_mentions(user_ids):
-    return " ".join(f"<@{user_id}>" for user_id in user_ids if user_id)
+    return " ".join([f"<@{user_id}>" for user_id in user_ids if user_id])
 
 
 def _normalize_user_key(value):
     return (value or "").strip().lower()
 
 
-def _build_workspace_user_index(client, logger):
-    user_index = {}
+# Yields (normalized_key, user_id) pairs one users.list page at a time; closing
+# the generator stops pagination. SlackApiError is left to the caller.
+def _iter_workspace_user_keys(client):
     cursor = None
+    while True:
+        response = client.users_list(limit=200, cursor=cursor)
+        members = response.get("members", [])
+        for member in members:
+            if member.get("deleted") or member.get("is_bot") or member.get("is_app_user"):
+                continue
+
+            user_id = member.get("id", "")
+            profile = member.get("profile", {})
+            keys = (
+                user_id,
+                member.get("name"),
+                profile.get("display_name"),
+                profile.get("display_name_normalized"),
+                profile.get("real_name"),
+                profile.get("real_name_normalized"),
+            )
+
+            # Same as _normalize_user_key, inlined: this runs for every workspace member.
+            for key in filter(None, keys):
+                normalized = key.strip().lower()
+                if normalized:
+                    yield normalized, user_id
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+
+def _lookup_workspace_user_ids(client, logger, normalized_keys):
+    with _USER_INDEX_LOCK:
+        now = time.monotonic()
+        if now > _USER_INDEX_CACHE["expires"]:
+            _USER_INDEX_CACHE["index"] = {}
+            _USER_INDEX_CACHE["complete"] = False
+            _USER_INDEX_CACHE["expires"] = now + USER_INDEX_TTL_SECONDS
+
+        user_index = _USER_INDEX_CACHE["index"]
+        found = {key: user_index[key] for key in normalized_keys if key in user_index}
+        pending = set(normalized_keys) - found.keys()
+        if not pending or _USER_INDEX_CACHE["complete"]:
+            return found
+
+    # Walk users.list without holding the lock: pages (and SDK 429 back-off)
+    # can take a while, and other triggers shouldn't queue behind them. Two
+    # concurrent misses may both walk; the results are merged below.
+    walked = {}
+    complete = False
+    users = _iter_workspace_user_keys(client)
     try:
-        while True:
-            response = client.users_list(limit=200, cursor=cursor)
-            members = response.get("members", [])
-            for member in members:
-                if member.get("deleted") or member.get("is_bot") or member.get("is_app_user"):
-                    continue
-
-                user_id = member.get("id", "")
-                profile = member.get("profile", {})
-                keys = [
-                    user_id,
-                    member.get("name", ""),
-                    profile.get("display_name", ""),
-                    profile.get("display_name_normalized", ""),
-                    profile.get("real_name", ""),
-                    profile.get("real_name_normalized", ""),
-                ]
-
-                for key in keys:
-                    normalized = _normalize_user_key(key)
-                    if normalized and normalized not in user_index:
-                        user_index[normalized] = user_id
-
-            cursor = response.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
+        for key, user_id in users:
+            # First member to claim a key keeps it.
+            walked_user_id = walked.setdefault(key, user_id)
+            if key in pending:
+                found[key] = walked_user_id
+                pending.discard(key)
+                if not pending:
+                    break
+        else:
+            complete = True
     except SlackApiError as e:
         logger.warning("Failed to fetch users list for mentions: %s", e.response.get("error"))
-        return {}
+    finally:
+        users.close()
+
+    with _USER_INDEX_LOCK:
+        # Skip the merge if the index expired and was replaced mid-walk.
+        if _USER_INDEX_CACHE["index"] is user_index:
+            for key, user_id in walked.items():
+                user_index.setdefault(key, user_id)
+            if complete:
+                # Walked every page, so a miss in the index is a real miss.
+                _USER_INDEX_CACHE["complete"] = True
 
-    return user_index
+    return found
 
 
 def _resolve_catchup_member_ids(client, logger):
+    global _CATCHUP_RESOLVED, _CATCHUP_PAYLOAD_CACHE
+    if _CATCHUP_RESOLVED is not None:
+        return _CATCHUP_RESOLVED
+
     unresolved_keys = []
-    resolved_user_ids = []
+    # dict keys keep insertion order and drop duplicates in one structure
+    resolved_user_ids = {}
 
     for member_ref in CATCHUP_MEMBER_IDS:
-        normalized_ref = _normalize_user_key(member_ref)
-        if not normalized_ref:
+        # Raw Slack ids need no normalization, so try them first.
+        if _is_slack_user_id(member_ref):
+            resolved_user_ids[member_ref] = None
             continue
 
-        if SLACK_USER_ID_REGEX.match(member_ref):
-            resolved_user_ids.append(member_ref)
+        normalized_ref = _normalize_user_key(member_ref)
+        if not normalized_ref:
             continue
 
-        cached_user_id = CATCHUP_USER_ID_CACHE.get(normalized_ref)
+        cached_user_id = _lru_get(CATCHUP_USER_ID_CACHE, normalized_ref)
         if cached_user_id:
-            resolved_user_ids.append(cached_user_id)
+            resolved_user_ids[cached_user_id] = None
         else:
             unresolved_keys.append(normalized_ref)
 
+    all_resolved = True
     if unresolved_keys:
-        user_index = _build_workspace_user_index(client, logger)
+        user_ids = _lookup_workspace_user_ids(client, logger, unresolved_keys)
         for unresolved_key in unresolved_keys:
-            resolved_user_id = user_index.get(unresolved_key)
+            resolved_user_id = user_ids.get(unresolved_key)
             if resolved_user_id:
-                CATCHUP_USER_ID_CACHE[unresolved_key] = resolved_user_id
-                resolved_user_ids.append(resolved_user_id)
+                _lru_set(CATCHUP_USER_ID_CACHE, unresolved_key, resolved_user_id, USER_ID_CACHE_MAX_SIZE)
+                resolved_user_ids[resolved_user_id] = None
             else:
+                all_resolved = False
                 logger.warning("Could not resolve CATCHUP member: %s", unresolved_key)
 
-    return list(dict.fromkeys(resolved_user_ids))
+    member_ids = list(resolved_user_ids)
+    if all_resolved:
+        _CATCHUP_RESOLVED = member_ids
+        if member_ids:
+            _CATCHUP_PAYLOAD_CACHE = f"{_build_mentions(member_ids)} {CATCHUP_MESSAGE_TEXT}".strip()
+    return member_ids
 
 
 def _resolve_area51_member_ids(client, logger):
+    global _AREA51_RESOLVED, _AREA51_PAYLOAD_CACHE
+    if _AREA51_RESOLVED is not None:
+        return _AREA51_RESOLVED
+
     unresolved_keys = []
-    resolved_user_ids = []
+    # dict keys keep insertion order and drop duplicates in one structure
+    resolved_user_ids = {}
 
     for member_ref in AREA51_MEMBER_IDS:
-        normalized_ref = _normalize_user_key(member_ref)
-        if not normalized_ref:
+        # Raw Slack ids need no normalization, so try them first.
+        if _is_slack_user_id(member_ref):
+            resolved_user_ids[member_ref] = None
             continue
 
-        if SLACK_USER_ID_REGEX.match(member_ref):
-            resolved_user_ids.append(member_ref)
+        normalized_ref = _normalize_user_key(member_ref)
+        if not normalized_ref:
             continue
 
-        cached_user_id = AREA51_USER_ID_CACHE.get(normalized_ref)
+        cached_user_id = _lru_get(AREA51_USER_ID_CACHE, normalized_ref)
         if cached_user_id:
-            resolved_user_ids.append(cached_user_id)
+            resolved_user_ids[cached_user_id] = None
         else:
             unresolved_keys.append(normalized_ref)
 
+    all_resolved = True
     if unresolved_keys:
-        user_index = _build_workspace_user_index(client, logger)
+        user_ids = _lookup_workspace_user_ids(client, logger, unresolved_keys)
         for unresolved_key in unresolved_keys:
-            resolved_user_id = user_index.get(unresolved_key)
+            resolved_user_id = user_ids.get(unresolved_key)
             if resolved_user_id:
-                AREA51_USER_ID_CACHE[unresolved_key] = resolved_user_id
-                resolved_user_ids.append(resolved_user_id)
+                _lru_set(AREA51_USER_ID_CACHE, unresolved_key, resolved_user_id, USER_ID_CACHE_MAX_SIZE)
+                resolved_user_ids[resolved_user_id] = None
             else:
+                all_resolved = False
                 logger.warning("Could not resolve AREA51 member: %s", unresolved_key)
 
-    # preserve order while removing duplicates
-    return list(dict.fromkeys(resolved_user_ids))
+    member_ids = list(resolved_user_ids)
+    if all_resolved:
+        # Every configured member is known now, skip the lookups next time.
+        _AREA51_RESOLVED = member_ids
+        if member_ids:
+            # The alert text is now fixed too; the handler posts it as-is.
+            _AREA51_PAYLOAD_CACHE = f"{_build_mentions(member_ids)} {AREA51_MESSAGE_TEXT}".strip()
+    return member_ids
 
 
 def _post_welcome_with_retry(client, channel_id, logger):
@@ -232,7 +419,7 @@ def _post_welcome_with_retry(client, channel_id, logger):
         "channel_not_found",
         "internal_error",
         "request_timeout",
-        "ratelimited",
+        # "ratelimited" is retried by the client's RateLimitErrorRetryHandler.
     }
     max_attempts = 4
 
@@ -311,49 +498,65 @@ def handle_member_joined_channel_events(body, client, logger):
 @bolt_app.event("message")
 def handle_message_events(body, client, logger):
     event = body["event"]
-    text = event.get("text", "")
+    # ignore bot-generated messages to avoid loops
+    if event.get("subtype", "") == "bot_message":
+        return
+
+    # Nothing below can act on an empty message: triggers and --save need text,
+    # and join system messages are recognised by their "has joined" text.
+    text = event.get("text") or ""
+    if not text:
+        return
+
     channel_id = event.get("channel")
     user_id = event.get("user")
-    subtype = event.get("subtype", "")
 
     if _is_join_system_message(event):
         if _welcome_if_bot_join_event(event, client, logger):
             return
 
-    # ignore bot-generated messages to avoid loops
-    if subtype == "bot_message":
-        return
+    # Cheap substring checks first; most messages match none of the triggers.
+    lowered = text.lower()
 
-    if channel_id and AREA51_TRIGGER_REGEX.search(text):
+    if channel_id and "area51" in lowered and AREA51_TRIGGER_REGEX.search(text):
         try:
-            member_ids = _resolve_area51_member_ids(client, logger)
-            if not member_ids:
-                logger.warning("No valid AREA51 members found for mention.")
-                return
-            mentions = _build_mentions(member_ids)
-            message = f"{mentions} {AREA51_MESSAGE_TEXT}".strip()
+            message = _AREA51_PAYLOAD_CACHE
+            if message is None:
+                member_ids = _resolve_area51_member_ids(client, logger)
+                if not member_ids:
+                    logger.warning("No valid AREA51 members found for mention.")
+                    return
+                mentions = _build_mentions(member_ids)
+                message = f"{mentions} {AREA51_MESSAGE_TEXT}".strip()
             client.chat_postMessage(channel=channel_id, text=message)
         except SlackApiError as e:
             logger.warning("Failed to send @area51 meeting alert: %s", e.response.get("error"))
         return
 
-    if channel_id and CATCHUP_TRIGGER_REGEX.search(text):
+    if channel_id and "@catchup" in lowered and CATCHUP_TRIGGER_REGEX.search(text):
         try:
-            member_ids = _resolve_catchup_member_ids(client, logger)
-            if not member_ids:
-                logger.warning("No valid CATCHUP members found for mention.")
-                return
-            mentions = _build_mentions(member_ids)
-            message = f"{mentions} {CATCHUP_MESSAGE_TEXT}".strip()
+            message = _CATCHUP_PAYLOAD_CACHE
+            if message is None:
+                member_ids = _resolve_catchup_member_ids(client, logger)
+                if not member_ids:
+                    logger.warning("No valid CATCHUP members found for mention.")
+                    return
+                mentions = _build_mentions(member_ids)
+                message = f"{mentions} {CATCHUP_MESSAGE_TEXT}".strip()
             client.chat_postMessage(channel=channel_id, text=message)
         except SlackApiError as e:
             logger.warning("Failed to send @catchup alert: %s", e.response.get("error"))
         return
 
-    if not channel_id or not SAVE_FLAG_REGEX.search(text):
+    if not channel_id or "--save" not in lowered:
         return
 
-    saved_text = SAVE_FLAG_REGEX.sub("", text).strip()
+    # subn both detects the flag and strips it in a single scan.
+    saved_text, flag_count = SAVE_FLAG_REGEX.subn("", text)
+    if not flag_count:
+        return
+
+    saved_text = saved_text.strip()
     if not saved_text:
         return
 
@@ -362,7 +565,7 @@ def handle_message_events(body, client, logger):
 
     try:
         canvas_id = _get_or_create_channel_canvas_id(client, channel_id, logger)
-        if not canvas_id or not CANVAS_ID_REGEX.match(canvas_id):
+        if not _is_canvas_id(canvas_id):
             logger.error("Unable to resolve a valid canvas_id for channel=%s", channel_id)
             return
 
@@ -380,23 +583,33 @@ def handle_message_events(body, client, logger):
             ],
         )
     except SlackApiError as e:
+        # The canvas may have been deleted; resolve it again on the next save.
+        _lru_pop(_CANVAS_ID_CACHE, channel_id)
         logger.error("Failed to update canvas: %s", e)
         return
 
-    # React ✅ on the message and send confirmation.
-    try:
-        client.reactions_add(
+    # React ✅ on the message and send confirmation; the two calls are independent.
+    mention = f"<@{user_id}> " if user_id else ""
+    futures = [
+        _SLACK_CALL_EXECUTOR.submit(
+            client.reactions_add,
             channel=channel_id,
             name="white_check_mark",
             timestamp=event["ts"],
-        )
-        mention = f"<@{user_id}> " if user_id else ""
-        client.chat_postMessage(
+        ),
+        _SLACK_CALL_EXECUTOR.submit(
+            client.chat_postMessage,
             channel=channel_id,
             text=f"{mention} Bhai apnar message canvas-e save hoye gese! :white_check_mark:",
-        )
-    except SlackApiError as e:
-        logger.warning("Saved to canvas but failed to react/confirm: %s", e.response.get("error"))
+        ),
+    ]
+    wait(futures, return_when=ALL_COMPLETED)
+    for future in futures:
+        e = future.exception()
+        if isinstance(e, SlackApiError):
+            logger.warning("Saved to canvas but failed to react/confirm: %s", e.response.get("error"))
+        elif e is not None:
+            logger.warning("Saved to canvas but failed to react/confirm: %s", e)
 
 # --- Flask server for Slack Events API ---
 flask_app = Flask(__name__)
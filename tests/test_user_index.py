@@ -0,0 +1,83 @@
+import logging
+
+from slack_sdk.errors import SlackApiError
+
+import app
+
+logger = logging.getLogger(__name__)
+
+
+def _member(user_id, name):
+    return {"id": user_id, "name": name, "profile": {"real_name": name.title()}}
+
+
+class FakeClient:
+    def __init__(self, pages, fail_on_page=None):
+        self.pages = pages
+        self.fail_on_page = fail_on_page
+        self.calls = []
+
+    def users_list(self, limit, cursor=None):
+        page = int(cursor or 0)
+        self.calls.append(page)
+        if page == self.fail_on_page:
+            raise SlackApiError("boom", {"ok": False, "error": "ratelimited"})
+        next_cursor = str(page + 1) if page + 1 < len(self.pages) else ""
+        return {"members": self.pages[page], "response_metadata": {"next_cursor": next_cursor}}
+
+
+PAGES = [
+    [_member("U1", "rumman"), _member("U2", "joy")],
+    [_member("U3", "anik")],
+    [_member("U4", "nuri")],
+]
+
+
+def test_stops_paginating_once_all_keys_found():
+    client = FakeClient(PAGES)
+
+    found = app._lookup_workspace_user_ids(client, logger, ["rumman", "joy"])
+
+    assert found == {"rumman": "U1", "joy": "U2"}
+    assert client.calls == [0]
+    assert app._USER_INDEX_CACHE["complete"] is False
+
+
+def test_miss_on_partial_index_walks_again():
+    app._lookup_workspace_user_ids(FakeClient(PAGES), logger, ["rumman"])
+
+    client = FakeClient(PAGES)
+    found = app._lookup_workspace_user_ids(client, logger, ["rumman", "nuri"])
+
+    assert found == {"rumman": "U1", "nuri": "U4"}
+    assert client.calls == [0, 1, 2]
+
+
+def test_complete_index_gives_real_miss_until_ttl_expires():
+    first = FakeClient(PAGES)
+    assert app._lookup_workspace_user_ids(first, logger, ["nobody"]) == {}
+    assert first.calls == [0, 1, 2]
+    assert app._USER_INDEX_CACHE["complete"] is True
+
+    cached = FakeClient(PAGES)
+    assert app._lookup_workspace_user_ids(cached, logger, ["nobody"]) == {}
+    assert cached.calls == []
+
+    app._USER_INDEX_CACHE["expires"] = 0.0
+    expired = FakeClient(PAGES)
+    assert app._lookup_workspace_user_ids(expired, logger, ["nobody"]) == {}
+    assert expired.calls == [0, 1, 2]
+
+
+def test_api_error_mid_walk_does_not_mark_index_complete():
+    client = FakeClient(PAGES, fail_on_page=1)
+
+    found = app._lookup_workspace_user_ids(client, logger, ["rumman", "nuri"])
+
+    assert found == {"rumman": "U1"}
+    assert app._USER_INDEX_CACHE["complete"] is False
+    # Pages fetched before the failure are still kept.
+    assert app._USER_INDEX_CACHE["index"]["joy"] == "U2"
+
+    retry = FakeClient(PAGES)
+    assert app._lookup_workspace_user_ids(retry, logger, ["nuri"]) == {"nuri": "U4"}